@@ -8,9 +8,10 @@ from abc import ABCMeta, abstractmethod
 from copy import deepcopy
 from datetime import date, datetime, time
 from decimal import Decimal
-from distutils.util import strtobool
 from typing import Any, Callable, Dict, Optional, Type
 
+from pyathena.util import strtobool
+
 _logger = logging.getLogger(__name__)  # type: ignore
 
 
@@ -53,7 +54,7 @@ def _to_decimal(varchar_value: Optional[str]) -> Optional[Decimal]:
 def _to_boolean(varchar_value: Optional[str]) -> Optional[bool]:
     if not varchar_value:
         return None
-    return bool(strtobool(varchar_value))
+    return strtobool(varchar_value)
 
 
 def _to_binary(varchar_value: Optional[str]) -> Optional[bytes]:
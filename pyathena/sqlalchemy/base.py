@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import re
-from distutils.util import strtobool
+import sys
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -36,6 +37,7 @@ import pyathena
 from pyathena.model import AthenaFileFormat, AthenaRowFormatSerde
 from pyathena.sqlalchemy.types import DOUBLE, STRUCT, AthenaDate, AthenaTimestamp
 from pyathena.sqlalchemy.util import _HashableDict
+from pyathena.util import strtobool
 
 if TYPE_CHECKING:
     from types import ModuleType
@@ -375,6 +377,31 @@ ischema_names: Dict[str, Type[Any]] = {
 }
 
 
+@lru_cache(maxsize=512)
+def _parse_column_type(type_: str) -> Tuple[str, Optional[str]]:
+    # Splits a type string such as `varchar(10)` or `array<int>` into its name and arguments.
+    # Reflected tables usually repeat the same few types, so the results are cached.
+    # The name is interned so that the `ischema_names` lookup matches the key by identity.
+    end = min((i for i in (type_.find("("), type_.find("<")) if i != -1), default=len(type_))
+    name, args = type_[:end], type_[end:][1:-1]
+    if args and type_[-1] in ")>" and name.isascii() and name.isalpha():
+        return sys.intern(name.lower()), args
+    return sys.intern(type_.lower()), None
+
+
+def _format_properties(properties: Mapping[Any, Any]) -> str:
+    return ",\n".join([f"\t'{k}' = '{v}'" for k, v in properties.items()])
+
+
+@lru_cache(maxsize=256)
+def _escape_comment_cached(value: str, double_percents: bool) -> str:
+    value = value.replace("\\", "\\\\").replace("'", r"\'")
+    # DDL statements raise a KeyError if the placeholders aren't escaped
+    if double_percents:
+        value = value.replace("%", "%%")
+    return f"'{value}'"
+
+
 class AthenaDMLIdentifierPreparer(IdentifierPreparer):
     reserved_words: Set[str] = SELECT_STATEMENT_RESERVED_WORDS
 
@@ -405,7 +432,7 @@ class AthenaDDLIdentifierPreparer(IdentifierPreparer):
 class AthenaStatementCompiler(SQLCompiler):
     def visit_struct_getitem_op_binary(self, binary, operator_, **kw):
         left = self.process(binary.left, **kw)
-        return f"{left}.{binary.right.value}"
+        return f"{left}.{binary.right.name}"
 
     def visit_getitem_binary(self, binary, operator_, **kw):
         left = self.process(binary.left, **kw)
@@ -451,9 +478,6 @@ class AthenaTypeCompiler(GenericTypeCompiler):
     def visit_DOUBLE(self, type_, **kw):
         return "DOUBLE"
 
-    def visit_NUMERIC(self, type_: Type[Any], **kw) -> str:
-        return self.visit_DECIMAL(type_, **kw)
-
     def visit_DECIMAL(self, type_: Type[Any], **kw) -> str:
         if type_.precision is None:
             return "DECIMAL"
@@ -462,6 +486,8 @@ class AthenaTypeCompiler(GenericTypeCompiler):
         else:
             return f"DECIMAL({type_.precision}, {type_.scale})"
 
+    visit_NUMERIC = visit_DECIMAL
+
     def visit_INTEGER(self, type_: Type[Any], **kw) -> str:
         return "INTEGER"
 
@@ -474,8 +500,7 @@ class AthenaTypeCompiler(GenericTypeCompiler):
     def visit_TIMESTAMP(self, type_: Type[Any], **kw) -> str:
         return "TIMESTAMP"
 
-    def visit_DATETIME(self, type_: Type[Any], **kw) -> str:
-        return self.visit_TIMESTAMP(type_, **kw)
+    visit_DATETIME = visit_TIMESTAMP
 
     def visit_DATE(self, type_: Type[Any], **kw) -> str:
         return "DATE"
@@ -483,39 +508,29 @@ class AthenaTypeCompiler(GenericTypeCompiler):
     def visit_TIME(self, type_: Type[Any], **kw) -> str:
         raise exc.CompileError(f"Data type `{type_}` is not supported")
 
-    def visit_CLOB(self, type_: Type[Any], **kw) -> str:
-        return self.visit_BINARY(type_, **kw)
-
-    def visit_NCLOB(self, type_: Type[Any], **kw) -> str:
-        return self.visit_BINARY(type_, **kw)
-
-    def visit_CHAR(self, type_: Type[Any], **kw) -> str:
+    def _render_string_type_or_string(self, type_: Type[Any], name: str) -> str:
+        # Athena has no unbounded CHAR or VARCHAR, so those fall back to STRING.
         if type_.length:
-            return cast(str, self._render_string_type(type_, "CHAR"))
+            return cast(str, self._render_string_type(type_, name))
         return "STRING"
 
-    def visit_NCHAR(self, type_: Type[Any], **kw) -> str:
-        return self.visit_CHAR(type_, **kw)
+    def visit_CHAR(self, type_: Type[Any], **kw) -> str:
+        return self._render_string_type_or_string(type_, "CHAR")
+
+    visit_NCHAR = visit_CHAR
 
     def visit_VARCHAR(self, type_: Type[Any], **kw) -> str:
-        if type_.length:
-            return cast(str, self._render_string_type(type_, "VARCHAR"))
-        return "STRING"
+        return self._render_string_type_or_string(type_, "VARCHAR")
 
-    def visit_NVARCHAR(self, type_: Type[Any], **kw) -> str:
-        return self.visit_VARCHAR(type_, **kw)
+    visit_NVARCHAR = visit_VARCHAR
 
     def visit_TEXT(self, type_: Type[Any], **kw) -> str:
         return "STRING"
 
-    def visit_BLOB(self, type_: Type[Any], **kw) -> str:
-        return self.visit_BINARY(type_, **kw)
-
     def visit_BINARY(self, type_: Type[Any], **kw) -> str:
         return "BINARY"
 
-    def visit_VARBINARY(self, type_: Type[Any], **kw) -> str:
-        return self.visit_BINARY(type_, **kw)
+    visit_BLOB = visit_CLOB = visit_NCLOB = visit_VARBINARY = visit_BINARY
 
     def visit_BOOLEAN(self, type_: Type[Any], **kw) -> str:
         return "BOOLEAN"
@@ -551,7 +566,7 @@ class AthenaDDLCompiler(DDLCompiler):
         render_schema_translate: bool = False,
         compile_kwargs: Mapping[str, Any] = util.immutabledict(),
     ):
-        self._preparer = AthenaDDLIdentifierPreparer(dialect)
+        self._preparer: IdentifierPreparer = cast(AthenaDialect, dialect)._ddl_preparer
         super(AthenaDDLCompiler, self).__init__(
             dialect=dialect,
             statement=statement,
@@ -561,11 +576,7 @@ class AthenaDDLCompiler(DDLCompiler):
         )
 
     def _escape_comment(self, value: str) -> str:
-        value = value.replace("\\", "\\\\").replace("'", r"\'")
-        # DDL statements raise a KeyError if the placeholders aren't escaped
-        if self.dialect.identifier_preparer._double_percents:
-            value = value.replace("%", "%%")
-        return f"'{value}'"
+        return _escape_comment_cached(value, self.dialect.identifier_preparer._double_percents)
 
     def _get_comment_specification(self, comment: str) -> str:
         return f"COMMENT {self._escape_comment(comment)}"
@@ -596,10 +607,7 @@ class AthenaDDLCompiler(DDLCompiler):
         self, dialect_opts: "_DialectArgDict", connect_opts: Dict[str, Any]
     ) -> str:
         file_format = self._get_file_format(dialect_opts, connect_opts)
-        text = []
-        if file_format:
-            text.append(f"STORED AS {file_format}")
-        return "\n".join(text)
+        return f"STORED AS {file_format}" if file_format else ""
 
     def _get_row_format(
         self, dialect_opts: "_DialectArgDict", connect_opts: Dict[str, Any]
@@ -616,10 +624,7 @@ class AthenaDDLCompiler(DDLCompiler):
         self, dialect_opts: "_DialectArgDict", connect_opts: Dict[str, Any]
     ) -> str:
         row_format = self._get_row_format(dialect_opts, connect_opts)
-        text = []
-        if row_format:
-            text.append(f"ROW FORMAT {row_format}")
-        return "\n".join(text)
+        return f"ROW FORMAT {row_format}" if row_format else ""
 
     def _get_serde_properties(
         self, dialect_opts: "_DialectArgDict", connect_opts: Dict[str, Any]
@@ -640,7 +645,7 @@ class AthenaDDLCompiler(DDLCompiler):
         if serde_properties:
             text.append("WITH SERDEPROPERTIES (")
             if isinstance(serde_properties, dict):
-                text.append(",\n".join([f"\t'{k}' = '{v}'" for k, v in serde_properties.items()]))
+                text.append(_format_properties(serde_properties))
             else:
                 text.append(serde_properties)
             text.append(")")
@@ -668,10 +673,7 @@ class AthenaDDLCompiler(DDLCompiler):
         self, table, dialect_opts: "_DialectArgDict", connect_opts: Dict[str, Any]
     ) -> str:
         location = self._get_table_location(table, dialect_opts, connect_opts)
-        text = []
-        if location:
-            text.append(f"LOCATION '{location}'")
-        else:
+        if not location:
             if connect_opts:
                 raise exc.CompileError(
                     "`location` or `s3_staging_dir` parameter is required "
@@ -682,7 +684,7 @@ class AthenaDDLCompiler(DDLCompiler):
                     "The location of the table should be specified "
                     "by the dialect keyword argument `awsathena_location`"
                 )
-        return "\n".join(text)
+        return f"LOCATION '{location}'"
 
     def _get_table_properties(
         self, dialect_opts: "_DialectArgDict", connect_opts: Dict[str, Any]
@@ -712,7 +714,7 @@ class AthenaDDLCompiler(DDLCompiler):
         properties = self._get_table_properties(dialect_opts, connect_opts)
         if properties:
             if isinstance(properties, dict):
-                table_properties = [",\n".join([f"\t'{k}' = '{v}'" for k, v in properties.items()])]
+                table_properties = [_format_properties(properties)]
             else:
                 table_properties = [properties]
         else:
@@ -745,15 +747,16 @@ class AthenaDDLCompiler(DDLCompiler):
         return "\n".join(text)
 
     def get_column_specification(self, column: "Column[Any]", **kwargs) -> str:
-        if isinstance(column.type, types.Integer) and not isinstance(
-            column.type, (types.SmallInteger, types.BigInteger)
+        column_type = column.type
+        if isinstance(column_type, types.Integer) and not isinstance(
+            column_type, (types.SmallInteger, types.BigInteger)
         ):
             # https://docs.aws.amazon.com/athena/latest/ug/create-table.html
             # In Data Definition Language (DDL) queries like CREATE TABLE,
             # use the int keyword to represent an integer
             type_ = "INT"
         else:
-            type_ = self.dialect.type_compiler.process(column.type, type_expression=column)
+            type_ = self.dialect.type_compiler.process(column_type, type_expression=column)
         text = [f"{self.preparer.format_column(column)} {type_}"]
         if column.comment:
             text.append(f"{self._get_comment_specification(column.comment)}")
@@ -832,10 +835,9 @@ class AthenaDDLCompiler(DDLCompiler):
         dialect = cast(AthenaDialect, self.dialect)
         connect_opts = dialect._connect_options
 
-        table_properties = self._get_table_properties_specification(
-            dialect_opts, connect_opts
-        ).lower()
-        if ("table_type" in table_properties) and ("iceberg" in table_properties):
+        table_properties = self._get_table_properties_specification(dialect_opts, connect_opts)
+        lower_table_properties = table_properties.lower()
+        if ("table_type" in lower_table_properties) and ("iceberg" in lower_table_properties):
             # https://docs.aws.amazon.com/athena/latest/ug/querying-iceberg-creating-tables.html
             text = ["\nCREATE TABLE"]
         else:
@@ -865,19 +867,21 @@ class AthenaDDLCompiler(DDLCompiler):
             text.append(",\n".join(buckets))
             text.append(f") INTO {bucket_count} BUCKETS")
 
-        text.append(f"{self.post_create_table(table)}\n")
+        text.append(f"{self.post_create_table(table, table_properties=table_properties)}\n")
         return "\n".join(text)
 
-    def post_create_table(self, table: "Table") -> str:
+    def post_create_table(self, table: "Table", table_properties: Optional[str] = None) -> str:
         dialect_opts: "_DialectArgDict" = table.dialect_options["awsathena"]
         dialect = cast(AthenaDialect, self.dialect)
         connect_opts = dialect._connect_options
+        if table_properties is None:
+            table_properties = self._get_table_properties_specification(dialect_opts, connect_opts)
         text = [
             self._get_row_format_specification(dialect_opts, connect_opts),
             self._get_serde_properties_specification(dialect_opts, connect_opts),
             self._get_file_format_specification(dialect_opts, connect_opts),
             self._get_table_location_specification(table, dialect_opts, connect_opts),
-            self._get_table_properties_specification(dialect_opts, connect_opts),
+            table_properties,
         ]
         return "\n".join([t for t in text if t])
 
@@ -936,7 +940,13 @@ class AthenaDialect(DefaultDialect):
     ischema_names: Dict[str, Type[Any]] = ischema_names
 
     _connect_options: Dict[str, Any] = dict()  # type: ignore
-    _pattern_column_type: Pattern[str] = re.compile(r"^([a-zA-Z]+)(?:$|[\(|<](.+)[\)|>]$)")
+    _pattern_host: Pattern[str] = re.compile(r"^athena\.([a-z0-9-]+)\.amazonaws\.(com|com\.cn)$")
+
+    @util.memoized_property
+    def _ddl_preparer(self) -> AthenaDDLIdentifierPreparer:
+        # The preparer only depends on the dialect,
+        # so it is shared by all DDL compilers created from this dialect.
+        return AthenaDDLIdentifierPreparer(self)
 
     @classmethod
     def import_dbapi(cls) -> "ModuleType":
@@ -959,22 +969,24 @@ class AthenaDialect(DefaultDialect):
         self._connect_options = self._create_connect_args(url)
         return cast(Tuple[str], tuple()), self._connect_options
 
+    def _get_region_name(self, host: Optional[str]) -> Optional[str]:
+        if not host:
+            return None
+        match = self._pattern_host.match(host)
+        return match.group(1) if match else host
+
     def _create_connect_args(self, url: "URL") -> Dict[str, Any]:
         opts: Dict[str, Any] = {
             "aws_access_key_id": url.username if url.username else None,
             "aws_secret_access_key": url.password if url.password else None,
-            "region_name": re.sub(
-                r"^athena\.([a-z0-9-]+)\.amazonaws\.(com|com.cn)$", r"\1", url.host
-            )
-            if url.host
-            else None,
+            "region_name": self._get_region_name(url.host),
             "schema_name": url.database if url.database else "default",
         }
         opts.update(url.query)
         if "verify" in opts:
             verify = opts["verify"]
             try:
-                verify = bool(strtobool(verify))
+                verify = strtobool(verify)
             except ValueError:
                 # Probably a file name of the CA cert bundle to use
                 pass
@@ -984,7 +996,7 @@ class AthenaDialect(DefaultDialect):
         if "poll_interval" in opts:
             opts.update({"poll_interval": float(opts["poll_interval"])})
         if "kill_on_interrupt" in opts:
-            opts.update({"kill_on_interrupt": bool(strtobool(opts["kill_on_interrupt"]))})
+            opts.update({"kill_on_interrupt": strtobool(opts["kill_on_interrupt"])})
         return opts
 
     @reflection.cache
@@ -1082,10 +1094,11 @@ class AthenaDialect(DefaultDialect):
         self, connection: "Connection", table_name: str, schema: Optional[str] = None, **kw
     ):
         metadata = self._get_table(connection, table_name, schema=schema, **kw)
+        get_column_type = self._get_column_type
         columns = [
             {
                 "name": c.name,
-                "type": self._get_column_type(c.type),
+                "type": get_column_type(c.type),
                 "nullable": True,
                 "default": None,
                 "autoincrement": False,
@@ -1097,7 +1110,7 @@ class AthenaDialect(DefaultDialect):
         columns += [
             {
                 "name": c.name,
-                "type": self._get_column_type(c.type),
+                "type": get_column_type(c.type),
                 "nullable": True,
                 "default": None,
                 "autoincrement": False,
@@ -1109,14 +1122,7 @@ class AthenaDialect(DefaultDialect):
         return columns
 
     def _get_column_type(self, type_: str):
-        match = self._pattern_column_type.match(type_)
-        if match:
-            name = match.group(1).lower()
-            column_type_args = match.group(2)
-        else:
-            name = type_.lower()
-            column_type_args = None
-
+        name, column_type_args = _parse_column_type(type_)
         if name in self.ischema_names:
             col_type = self.ischema_names[name]
         else:
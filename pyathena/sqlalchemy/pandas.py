@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
-from distutils.util import strtobool
-
 from pyathena.sqlalchemy.base import AthenaDialect
+from pyathena.util import strtobool
 
 
 class AthenaPandasDialect(AthenaDialect):
@@ -15,7 +14,7 @@ class AthenaPandasDialect(AthenaDialect):
         opts.update({"cursor_class": PandasCursor})
         cursor_kwargs = dict()
         if "unload" in opts:
-            cursor_kwargs.update({"unload": bool(strtobool(opts.pop("unload")))})
+            cursor_kwargs.update({"unload": strtobool(opts.pop("unload"))})
         if "engine" in opts:
             cursor_kwargs.update({"engine": opts.pop("engine")})
         if "chunksize" in opts:
@@ -11,7 +11,6 @@ from sqlalchemy.sql.sqltypes import Float, Indexable
 from sqlalchemy.sql.type_api import TypeEngine, UserDefinedType
 
 from pyathena.sqlalchemy import base
-from pyathena.sqlalchemy.constants import sqlalchemy_1_4_or_more
 
 if TYPE_CHECKING:
     from sqlalchemy import Dialect
@@ -50,11 +49,6 @@ class AthenaDate(TypeEngine[date]):
         return self.process
 
 
-if sqlalchemy_1_4_or_more:
-    import sqlalchemy.sql.coercions
-    import sqlalchemy.sql.roles
-
-
 def _get_subtype_col_spec(type_):
     global _get_subtype_col_spec
 
@@ -73,6 +67,10 @@ class STRUCT(Indexable, UserDefinedType):  # type: ignore
 
     # See https://docs.sqlalchemy.org/en/14/core/custom_types.html#creating-new-types
 
+    # Statements using this type can be served from SQLAlchemy's compiled cache.
+    # The cache key is built from the struct fields in `_static_cache_key` below.
+    cache_ok = True
+
     def __init__(
         self,
         *fields,
@@ -95,6 +93,15 @@ class STRUCT(Indexable, UserDefinedType):  # type: ignore
         fields = ", ".join(f"{name}={repr(type_)}" for name, type_ in self._struct_fields)
         return f"STRUCT({fields})"
 
+    @property
+    def _static_cache_key(self):
+        # The fields are given as positional/variadic arguments,
+        # so the default implementation based on the keyword arguments of `__init__`
+        # cannot tell structs with different fields apart.
+        return (self.__class__,) + tuple(
+            (name, type_._static_cache_key) for name, type_ in self._struct_fields
+        )
+
     def get_col_spec(self, **kw):
         fields = ", ".join(
             f"{name}: {_get_subtype_col_spec(type_)}" for name, type_ in self._struct_fields
@@ -115,7 +122,7 @@ class STRUCT(Indexable, UserDefinedType):  # type: ignore
             if subtype is None:
                 raise KeyError(name)
             operator = struct_getitem_op
-            index = _field_index(self, name, operator)
+            index = _field_index(name)
             return operator, index, subtype
 
         def __getattr__(self, name):
@@ -125,29 +132,11 @@ class STRUCT(Indexable, UserDefinedType):  # type: ignore
     comparator_factory = Comparator
 
 
-# In the implementations of _field_index below, we're stealing from
-# the JSON type implementation, but the code to steal changed in
-# 1.4. :/
-if sqlalchemy_1_4_or_more:
-
-    def _field_index(self, name, operator):
-        return sqlalchemy.sql.coercions.expect(
-            sqlalchemy.sql.roles.BinaryElementRole,
-            name,
-            expr=self.expr,
-            operator=operator,
-            bindparam_type=sqlalchemy.types.String(),
-        )
-
-else:
-
-    def _field_index(self, name, operator):
-        return sqlalchemy.sql.default_comparator._check_literal(  # type: ignore
-            self.expr,
-            operator,
-            name,
-            bindparam_type=sqlalchemy.types.String(),
-        )
+def _field_index(name):
+    # The field name is rendered into the SQL as is, so it must be part of the cache key.
+    # A bound parameter would be left out of it and statements accessing different fields
+    # of the same STRUCT would share one compiled statement.
+    return sqlalchemy.sql.expression.literal_column(name, sqlalchemy.types.String())
 
 
 def struct_getitem_op(a, b):
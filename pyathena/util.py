@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Callable, Iterable, Optional, Pattern, Tuple
+from typing import Any, Callable, FrozenSet, Iterable, Optional, Pattern, Tuple
 
 import tenacity
 from tenacity import after_log, retry_if_exception, stop_after_attempt, wait_exponential
@@ -16,6 +16,9 @@ PATTERN_OUTPUT_LOCATION: Pattern[str] = re.compile(
     r"^s3://(?P<bucket>[a-zA-Z0-9.\-_]+)/(?P<key>.+)$"
 )
 
+_TRUE_VALUES: FrozenSet[str] = frozenset(("y", "yes", "t", "true", "on", "1"))
+_FALSE_VALUES: FrozenSet[str] = frozenset(("n", "no", "f", "false", "off", "0"))
+
 
 def parse_output_location(output_location: str) -> Tuple[str, str]:
     match = PATTERN_OUTPUT_LOCATION.search(output_location)
@@ -25,6 +28,16 @@ def parse_output_location(output_location: str) -> Tuple[str, str]:
         raise DataError("Unknown `output_location` format.")
 
 
+def strtobool(val: str) -> bool:
+    # Same values as `distutils.util.strtobool`, which is deprecated and removed in Python 3.12.
+    val = val.lower()
+    if val in _TRUE_VALUES:
+        return True
+    elif val in _FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid truth value {val!r}")
+
+
 class RetryConfig:
     def __init__(
         self,
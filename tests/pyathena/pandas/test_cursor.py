@@ -18,20 +18,197 @@ from pyathena.pandas.result_set import AthenaPandasResultSet
 from tests import ENV
 from tests.pyathena.conftest import connect
 
+_TABLE_SUFFIX_ALPHABET = string.ascii_lowercase + string.digits
+
+# Shared by the tests that run both with and without the unload option.
+_parametrize_engine_and_chunksize = pytest.mark.parametrize(
+    "pandas_cursor, parquet_engine, chunksize",
+    [
+        ({"cursor_kwargs": {"unload": False}}, "auto", None),
+        ({"cursor_kwargs": {"unload": False}}, "auto", 1_000),
+        ({"cursor_kwargs": {"unload": False}}, "auto", 1_000_000),
+        ({"cursor_kwargs": {"unload": True}}, "auto", None),
+        ({"cursor_kwargs": {"unload": True}}, "pyarrow", None),
+        ({"cursor_kwargs": {"unload": True}}, "fastparquet", None),
+    ],
+    indirect=["pandas_cursor"],
+)
+_parametrize_engine = pytest.mark.parametrize(
+    "pandas_cursor, parquet_engine",
+    [
+        ({"cursor_kwargs": {"unload": False}}, "auto"),
+        ({"cursor_kwargs": {"unload": True}}, "auto"),
+        ({"cursor_kwargs": {"unload": True}}, "pyarrow"),
+        ({"cursor_kwargs": {"unload": True}}, "fastparquet"),
+    ],
+    indirect=["pandas_cursor"],
+)
+
+_EXPECTED_DESCRIPTION_COMPLEX = [
+    ("col_boolean", "boolean", None, None, 0, 0, "UNKNOWN"),
+    ("col_tinyint", "tinyint", None, None, 3, 0, "UNKNOWN"),
+    ("col_smallint", "smallint", None, None, 5, 0, "UNKNOWN"),
+    ("col_int", "integer", None, None, 10, 0, "UNKNOWN"),
+    ("col_bigint", "bigint", None, None, 19, 0, "UNKNOWN"),
+    ("col_float", "float", None, None, 17, 0, "UNKNOWN"),
+    ("col_double", "double", None, None, 17, 0, "UNKNOWN"),
+    ("col_string", "varchar", None, None, 2147483647, 0, "UNKNOWN"),
+    ("col_varchar", "varchar", None, None, 10, 0, "UNKNOWN"),
+    ("col_timestamp", "timestamp", None, None, 3, 0, "UNKNOWN"),
+    ("col_time", "time", None, None, 3, 0, "UNKNOWN"),
+    ("col_date", "date", None, None, 0, 0, "UNKNOWN"),
+    ("col_binary", "varbinary", None, None, 1073741824, 0, "UNKNOWN"),
+    ("col_array", "array", None, None, 0, 0, "UNKNOWN"),
+    ("col_array_json", "json", None, None, 0, 0, "UNKNOWN"),
+    ("col_map", "map", None, None, 0, 0, "UNKNOWN"),
+    ("col_map_json", "json", None, None, 0, 0, "UNKNOWN"),
+    ("col_struct", "row", None, None, 0, 0, "UNKNOWN"),
+    ("col_decimal", "decimal", None, None, 10, 1, "UNKNOWN"),
+]
+_EXPECTED_ROWS_COMPLEX = [
+    (
+        True,
+        127,
+        32767,
+        2147483647,
+        9223372036854775807,
+        0.5,
+        0.25,
+        "a string",
+        "varchar",
+        pd.Timestamp(2017, 1, 1, 0, 0, 0),
+        datetime(2017, 1, 1, 0, 0, 0).time(),
+        pd.Timestamp(2017, 1, 2),
+        b"123",
+        "[1, 2]",
+        [1, 2],
+        "{1=2, 3=4}",
+        {"1": 2, "3": 4},
+        "{a=1, b=2}",
+        Decimal("0.1"),
+    )
+]
+_EXPECTED_DESCRIPTION_COMPLEX_UNLOAD_PYARROW = [
+    ("col_boolean", "boolean", None, None, 0, 0, "NULLABLE"),
+    (
+        "col_tinyint",
+        "tinyint",
+        None,
+        None,
+        3,
+        0,
+        "NULLABLE",
+    ),
+    (
+        "col_smallint",
+        "smallint",
+        None,
+        None,
+        5,
+        0,
+        "NULLABLE",
+    ),
+    ("col_int", "integer", None, None, 10, 0, "NULLABLE"),
+    ("col_bigint", "bigint", None, None, 19, 0, "NULLABLE"),
+    ("col_float", "float", None, None, 17, 0, "NULLABLE"),
+    ("col_double", "double", None, None, 17, 0, "NULLABLE"),
+    ("col_string", "varchar", None, None, 2147483647, 0, "NULLABLE"),
+    ("col_varchar", "varchar", None, None, 2147483647, 0, "NULLABLE"),
+    ("col_timestamp", "timestamp", None, None, 3, 0, "NULLABLE"),
+    ("col_date", "date", None, None, 0, 0, "NULLABLE"),
+    ("col_binary", "varbinary", None, None, 1073741824, 0, "NULLABLE"),
+    ("col_array", "array", None, None, 0, 0, "NULLABLE"),
+    ("col_map", "map", None, None, 0, 0, "NULLABLE"),
+    ("col_struct", "row", None, None, 0, 0, "NULLABLE"),
+    ("col_decimal", "decimal", None, None, 10, 1, "NULLABLE"),
+]
+_EXPECTED_ROWS_COMPLEX_UNLOAD_PYARROW = [
+    (
+        True,
+        127,
+        32767,
+        2147483647,
+        9223372036854775807,
+        0.5,
+        0.25,
+        "a string",
+        "varchar",
+        pd.Timestamp(2017, 1, 1, 0, 0, 0),
+        datetime(2017, 1, 2).date(),
+        b"123",
+        # ValueError: The truth value of an array with more than one element is ambiguous.
+        # Use a.any() or a.all()
+        [a for a in np.array([1, 2], dtype=np.int32)],
+        [(1, 2), (3, 4)],
+        {"a": 1, "b": 2},
+        Decimal("0.1"),
+    )
+]
+_EXPECTED_DESCRIPTION_COMPLEX_UNLOAD_FASTPARQUET = [
+    ("col_boolean", "boolean", None, None, 0, 0, "NULLABLE"),
+    (
+        "col_tinyint",
+        "integer",
+        None,
+        None,
+        10,
+        0,
+        "NULLABLE",
+    ),
+    (
+        "col_smallint",
+        "integer",
+        None,
+        None,
+        10,
+        0,
+        "NULLABLE",
+    ),
+    ("col_int", "integer", None, None, 10, 0, "NULLABLE"),
+    ("col_bigint", "bigint", None, None, 19, 0, "NULLABLE"),
+    ("col_float", "float", None, None, 17, 0, "NULLABLE"),
+    ("col_double", "double", None, None, 17, 0, "NULLABLE"),
+    ("col_string", "varchar", None, None, 2147483647, 0, "NULLABLE"),
+    ("col_varchar", "varchar", None, None, 2147483647, 0, "NULLABLE"),
+    ("col_timestamp", "timestamp", None, None, 3, 0, "NULLABLE"),
+    ("col_date", "date", None, None, 0, 0, "NULLABLE"),
+    ("col_binary", "varbinary", None, None, 1073741824, 0, "NULLABLE"),
+    ("col_array", "array", None, None, 0, 0, "NULLABLE"),
+    ("col_map", "map", None, None, 0, 0, "NULLABLE"),
+    ("col_decimal", "decimal", None, None, 10, 1, "NULLABLE"),
+    # In the case of fastparquet, child elements of struct types are handled
+    # as fields separated by dots.
+    ("col_struct.a", "integer", None, None, 10, 0, "NULLABLE"),
+    ("col_struct.b", "integer", None, None, 10, 0, "NULLABLE"),
+]
+_EXPECTED_ROWS_COMPLEX_UNLOAD_FASTPARQUET = [
+    (
+        True,
+        127,
+        32767,
+        2147483647,
+        9223372036854775807,
+        0.5,
+        0.25,
+        "a string",
+        "varchar",
+        pd.Timestamp(2017, 1, 1, 0, 0, 0),
+        pd.Timestamp(2017, 1, 2, 0, 0, 0),
+        b"123",
+        # ValueError: The truth value of an array with more than one element is ambiguous.
+        # Use a.any() or a.all()
+        [a for a in np.array([1, 2], dtype=np.int32)],
+        {1: 2, 3: 4},
+        # In the case of fastparquet, decimal types are handled as floats.
+        0.1,
+        1,
+        2,
+    )
+]
+
 
 class TestPandasCursor:
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine, chunksize",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto", None),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000_000),
-            ({"cursor_kwargs": {"unload": True}}, "auto", None),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow", None),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet", None),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine_and_chunksize
     def test_fetchone(self, pandas_cursor, parquet_engine, chunksize):
         pandas_cursor.execute("SELECT * FROM one_row", engine=parquet_engine, chunksize=chunksize)
         assert pandas_cursor.rownumber == 0
@@ -39,18 +216,7 @@ class TestPandasCursor:
         assert pandas_cursor.rownumber == 1
         assert pandas_cursor.fetchone() is None
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine, chunksize",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto", None),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000_000),
-            ({"cursor_kwargs": {"unload": True}}, "auto", None),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow", None),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet", None),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine_and_chunksize
     def test_fetchmany(self, pandas_cursor, parquet_engine, chunksize):
         pandas_cursor.execute(
             "SELECT * FROM many_rows LIMIT 15",
@@ -81,60 +247,26 @@ class TestPandasCursor:
         else:
             assert len(df) == 15
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine, chunksize",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto", None),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000_000),
-            ({"cursor_kwargs": {"unload": True}}, "auto", None),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow", None),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet", None),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine_and_chunksize
     def test_fetchall(self, pandas_cursor, parquet_engine, chunksize):
         pandas_cursor.execute("SELECT * FROM one_row", engine=parquet_engine, chunksize=chunksize)
         assert pandas_cursor.fetchall() == [(1,)]
         pandas_cursor.execute("SELECT a FROM many_rows ORDER BY a", engine=parquet_engine)
-        assert pandas_cursor.fetchall() == [(i,) for i in range(10000)]
+        rows = pandas_cursor.fetchall()
+        assert len(rows) == 10000
+        np.testing.assert_array_equal(
+            np.fromiter((r[0] for r in rows), dtype=np.int64, count=10000), np.arange(10000)
+        )
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine, chunksize",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto", None),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000_000),
-            ({"cursor_kwargs": {"unload": True}}, "auto", None),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow", None),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet", None),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine_and_chunksize
     def test_iterator(self, pandas_cursor, parquet_engine, chunksize):
         pandas_cursor.execute("SELECT * FROM one_row", engine=parquet_engine, chunksize=chunksize)
         assert list(pandas_cursor) == [(1,)]
         pytest.raises(StopIteration, pandas_cursor.__next__)
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine, chunksize",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto", None),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000_000),
-            ({"cursor_kwargs": {"unload": True}}, "auto", None),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow", None),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet", None),
-        ],
-        indirect=["pandas_cursor"],
-    )
-    def test_arraysize(self, pandas_cursor, parquet_engine, chunksize):
+    def test_arraysize(self, pandas_cursor):
         pandas_cursor.arraysize = 5
-        pandas_cursor.execute(
-            "SELECT * FROM many_rows LIMIT 20",
-            engine=parquet_engine,
-            chunksize=chunksize,
-        )
+        pandas_cursor.execute("SELECT * FROM many_rows LIMIT 20")
         assert len(pandas_cursor.fetchmany()) == 5
 
     def test_arraysize_default(self, pandas_cursor):
@@ -182,50 +314,8 @@ class TestPandasCursor:
             """,
             chunksize=chunksize,
         )
-        assert pandas_cursor.description == [
-            ("col_boolean", "boolean", None, None, 0, 0, "UNKNOWN"),
-            ("col_tinyint", "tinyint", None, None, 3, 0, "UNKNOWN"),
-            ("col_smallint", "smallint", None, None, 5, 0, "UNKNOWN"),
-            ("col_int", "integer", None, None, 10, 0, "UNKNOWN"),
-            ("col_bigint", "bigint", None, None, 19, 0, "UNKNOWN"),
-            ("col_float", "float", None, None, 17, 0, "UNKNOWN"),
-            ("col_double", "double", None, None, 17, 0, "UNKNOWN"),
-            ("col_string", "varchar", None, None, 2147483647, 0, "UNKNOWN"),
-            ("col_varchar", "varchar", None, None, 10, 0, "UNKNOWN"),
-            ("col_timestamp", "timestamp", None, None, 3, 0, "UNKNOWN"),
-            ("col_time", "time", None, None, 3, 0, "UNKNOWN"),
-            ("col_date", "date", None, None, 0, 0, "UNKNOWN"),
-            ("col_binary", "varbinary", None, None, 1073741824, 0, "UNKNOWN"),
-            ("col_array", "array", None, None, 0, 0, "UNKNOWN"),
-            ("col_array_json", "json", None, None, 0, 0, "UNKNOWN"),
-            ("col_map", "map", None, None, 0, 0, "UNKNOWN"),
-            ("col_map_json", "json", None, None, 0, 0, "UNKNOWN"),
-            ("col_struct", "row", None, None, 0, 0, "UNKNOWN"),
-            ("col_decimal", "decimal", None, None, 10, 1, "UNKNOWN"),
-        ]
-        assert pandas_cursor.fetchall() == [
-            (
-                True,
-                127,
-                32767,
-                2147483647,
-                9223372036854775807,
-                0.5,
-                0.25,
-                "a string",
-                "varchar",
-                pd.Timestamp(2017, 1, 1, 0, 0, 0),
-                datetime(2017, 1, 1, 0, 0, 0).time(),
-                pd.Timestamp(2017, 1, 2),
-                b"123",
-                "[1, 2]",
-                [1, 2],
-                "{1=2, 3=4}",
-                {"1": 2, "3": 4},
-                "{a=1, b=2}",
-                Decimal("0.1"),
-            )
-        ]
+        assert pandas_cursor.description == _EXPECTED_DESCRIPTION_COMPLEX
+        assert pandas_cursor.fetchall() == _EXPECTED_ROWS_COMPLEX
 
     @pytest.mark.parametrize(
         "pandas_cursor, parquet_engine",
@@ -260,40 +350,7 @@ class TestPandasCursor:
             """,
             engine=parquet_engine,
         )
-        assert pandas_cursor.description == [
-            ("col_boolean", "boolean", None, None, 0, 0, "NULLABLE"),
-            (
-                "col_tinyint",
-                "tinyint",
-                None,
-                None,
-                3,
-                0,
-                "NULLABLE",
-            ),
-            (
-                "col_smallint",
-                "smallint",
-                None,
-                None,
-                5,
-                0,
-                "NULLABLE",
-            ),
-            ("col_int", "integer", None, None, 10, 0, "NULLABLE"),
-            ("col_bigint", "bigint", None, None, 19, 0, "NULLABLE"),
-            ("col_float", "float", None, None, 17, 0, "NULLABLE"),
-            ("col_double", "double", None, None, 17, 0, "NULLABLE"),
-            ("col_string", "varchar", None, None, 2147483647, 0, "NULLABLE"),
-            ("col_varchar", "varchar", None, None, 2147483647, 0, "NULLABLE"),
-            ("col_timestamp", "timestamp", None, None, 3, 0, "NULLABLE"),
-            ("col_date", "date", None, None, 0, 0, "NULLABLE"),
-            ("col_binary", "varbinary", None, None, 1073741824, 0, "NULLABLE"),
-            ("col_array", "array", None, None, 0, 0, "NULLABLE"),
-            ("col_map", "map", None, None, 0, 0, "NULLABLE"),
-            ("col_struct", "row", None, None, 0, 0, "NULLABLE"),
-            ("col_decimal", "decimal", None, None, 10, 1, "NULLABLE"),
-        ]
+        assert pandas_cursor.description == _EXPECTED_DESCRIPTION_COMPLEX_UNLOAD_PYARROW
         rows = [
             tuple(
                 [
@@ -317,28 +374,7 @@ class TestPandasCursor:
             )
             for row in pandas_cursor.fetchall()
         ]
-        assert rows == [
-            (
-                True,
-                127,
-                32767,
-                2147483647,
-                9223372036854775807,
-                0.5,
-                0.25,
-                "a string",
-                "varchar",
-                pd.Timestamp(2017, 1, 1, 0, 0, 0),
-                datetime(2017, 1, 2).date(),
-                b"123",
-                # ValueError: The truth value of an array with more than one element is ambiguous.
-                # Use a.any() or a.all()
-                [a for a in np.array([1, 2], dtype=np.int32)],
-                [(1, 2), (3, 4)],
-                {"a": 1, "b": 2},
-                Decimal("0.1"),
-            )
-        ]
+        assert rows == _EXPECTED_ROWS_COMPLEX_UNLOAD_PYARROW
 
     @pytest.mark.parametrize(
         "pandas_cursor",
@@ -374,43 +410,7 @@ class TestPandasCursor:
             """,
             engine="fastparquet",
         )
-        assert pandas_cursor.description == [
-            ("col_boolean", "boolean", None, None, 0, 0, "NULLABLE"),
-            (
-                "col_tinyint",
-                "integer",
-                None,
-                None,
-                10,
-                0,
-                "NULLABLE",
-            ),
-            (
-                "col_smallint",
-                "integer",
-                None,
-                None,
-                10,
-                0,
-                "NULLABLE",
-            ),
-            ("col_int", "integer", None, None, 10, 0, "NULLABLE"),
-            ("col_bigint", "bigint", None, None, 19, 0, "NULLABLE"),
-            ("col_float", "float", None, None, 17, 0, "NULLABLE"),
-            ("col_double", "double", None, None, 17, 0, "NULLABLE"),
-            ("col_string", "varchar", None, None, 2147483647, 0, "NULLABLE"),
-            ("col_varchar", "varchar", None, None, 2147483647, 0, "NULLABLE"),
-            ("col_timestamp", "timestamp", None, None, 3, 0, "NULLABLE"),
-            ("col_date", "date", None, None, 0, 0, "NULLABLE"),
-            ("col_binary", "varbinary", None, None, 1073741824, 0, "NULLABLE"),
-            ("col_array", "array", None, None, 0, 0, "NULLABLE"),
-            ("col_map", "map", None, None, 0, 0, "NULLABLE"),
-            ("col_decimal", "decimal", None, None, 10, 1, "NULLABLE"),
-            # In the case of fastparquet, child elements of struct types are handled
-            # as fields separated by dots.
-            ("col_struct.a", "integer", None, None, 10, 0, "NULLABLE"),
-            ("col_struct.b", "integer", None, None, 10, 0, "NULLABLE"),
-        ]
+        assert pandas_cursor.description == _EXPECTED_DESCRIPTION_COMPLEX_UNLOAD_FASTPARQUET
         rows = [
             tuple(
                 [
@@ -435,30 +435,7 @@ class TestPandasCursor:
             )
             for row in pandas_cursor.fetchall()
         ]
-        assert rows == [
-            (
-                True,
-                127,
-                32767,
-                2147483647,
-                9223372036854775807,
-                0.5,
-                0.25,
-                "a string",
-                "varchar",
-                pd.Timestamp(2017, 1, 1, 0, 0, 0),
-                pd.Timestamp(2017, 1, 2, 0, 0, 0),
-                b"123",
-                # ValueError: The truth value of an array with more than one element is ambiguous.
-                # Use a.any() or a.all()
-                [a for a in np.array([1, 2], dtype=np.int32)],
-                {1: 2, 3: 4},
-                # In the case of fastparquet, decimal types are handled as floats.
-                0.1,
-                1,
-                2,
-            )
-        ]
+        assert rows == _EXPECTED_ROWS_COMPLEX_UNLOAD_FASTPARQUET
 
     def test_fetch_no_data(self, pandas_cursor):
         pytest.raises(ProgrammingError, pandas_cursor.fetchone)
@@ -466,18 +443,7 @@ class TestPandasCursor:
         pytest.raises(ProgrammingError, pandas_cursor.fetchall)
         pytest.raises(ProgrammingError, pandas_cursor.as_pandas)
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine, chunksize",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto", None),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000_000),
-            ({"cursor_kwargs": {"unload": True}}, "auto", None),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow", None),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet", None),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine_and_chunksize
     def test_as_pandas(self, pandas_cursor, parquet_engine, chunksize):
         df = pandas_cursor.execute(
             "SELECT * FROM one_row", engine=parquet_engine, chunksize=chunksize
@@ -488,27 +454,20 @@ class TestPandasCursor:
         assert df.shape[1] == 1
         assert [(row["number_of_rows"],) for _, row in df.iterrows()] == [(1,)]
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine, chunksize",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto", None),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000_000),
-            ({"cursor_kwargs": {"unload": True}}, "auto", None),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow", None),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet", None),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine_and_chunksize
     def test_many_as_pandas(self, pandas_cursor, parquet_engine, chunksize):
         df = pandas_cursor.execute(
             "SELECT * FROM many_rows", engine=parquet_engine, chunksize=chunksize
         ).as_pandas()
-        if chunksize:
-            df = pd.concat((d for d in df), ignore_index=True)
-        assert df.shape[0] == 10000
-        assert df.shape[1] == 1
-        assert [(row["a"],) for _, row in df.iterrows()] == [(i,) for i in range(10000)]
+        # Check the chunks one by one instead of concatenating them into a single DataFrame.
+        num_rows = 0
+        for d in df if chunksize else [df]:
+            assert d.shape[1] == 1
+            np.testing.assert_array_equal(
+                d["a"].to_numpy(), np.arange(num_rows, num_rows + d.shape[0])
+            )
+            num_rows += d.shape[0]
+        assert num_rows == 10000
 
     @pytest.mark.parametrize(
         "pandas_cursor, chunksize",
@@ -550,29 +509,7 @@ class TestPandasCursor:
             df = pd.concat((d for d in df), ignore_index=True)
         assert df.shape[0] == 1
         assert df.shape[1] == 19
-        dtypes = tuple(
-            [
-                df["col_boolean"].dtype.type,
-                df["col_tinyint"].dtype.type,
-                df["col_smallint"].dtype.type,
-                df["col_int"].dtype.type,
-                df["col_bigint"].dtype.type,
-                df["col_float"].dtype.type,
-                df["col_double"].dtype.type,
-                df["col_string"].dtype.type,
-                df["col_varchar"].dtype.type,
-                df["col_timestamp"].dtype.type,
-                df["col_time"].dtype.type,
-                df["col_date"].dtype.type,
-                df["col_binary"].dtype.type,
-                df["col_array"].dtype.type,
-                df["col_array_json"].dtype.type,
-                df["col_map"].dtype.type,
-                df["col_map_json"].dtype.type,
-                df["col_struct"].dtype.type,
-                df["col_decimal"].dtype.type,
-            ]
-        )
+        dtypes = tuple(t.type for t in df.dtypes)
         assert dtypes == tuple(
             [
                 np.bool_,
@@ -596,55 +533,8 @@ class TestPandasCursor:
                 np.object_,
             ]
         )
-        rows = [
-            tuple(
-                [
-                    row["col_boolean"],
-                    row["col_tinyint"],
-                    row["col_smallint"],
-                    row["col_int"],
-                    row["col_bigint"],
-                    row["col_float"],
-                    row["col_double"],
-                    row["col_string"],
-                    row["col_varchar"],
-                    row["col_timestamp"],
-                    row["col_time"],
-                    row["col_date"],
-                    row["col_binary"],
-                    row["col_array"],
-                    row["col_array_json"],
-                    row["col_map"],
-                    row["col_map_json"],
-                    row["col_struct"],
-                    row["col_decimal"],
-                ]
-            )
-            for _, row in df.iterrows()
-        ]
-        assert rows == [
-            (
-                True,
-                127,
-                32767,
-                2147483647,
-                9223372036854775807,
-                0.5,
-                0.25,
-                "a string",
-                "varchar",
-                pd.Timestamp(2017, 1, 1, 0, 0, 0),
-                datetime(2017, 1, 1, 0, 0, 0).time(),
-                pd.Timestamp(2017, 1, 2),
-                b"123",
-                "[1, 2]",
-                [1, 2],
-                "{1=2, 3=4}",
-                {"1": 2, "3": 4},
-                "{a=1, b=2}",
-                Decimal("0.1"),
-            )
-        ]
+        rows = list(df.itertuples(index=False, name=None))
+        assert rows == _EXPECTED_ROWS_COMPLEX
 
     @pytest.mark.parametrize(
         "pandas_cursor, parquet_engine",
@@ -681,26 +571,7 @@ class TestPandasCursor:
         ).as_pandas()
         assert df.shape[0] == 1
         assert df.shape[1] == 16
-        dtypes = tuple(
-            [
-                df["col_boolean"].dtype.type,
-                df["col_tinyint"].dtype.type,
-                df["col_smallint"].dtype.type,
-                df["col_int"].dtype.type,
-                df["col_bigint"].dtype.type,
-                df["col_float"].dtype.type,
-                df["col_double"].dtype.type,
-                df["col_string"].dtype.type,
-                df["col_varchar"].dtype.type,
-                df["col_timestamp"].dtype.type,
-                df["col_date"].dtype.type,
-                df["col_binary"].dtype.type,
-                df["col_array"].dtype.type,
-                df["col_map"].dtype.type,
-                df["col_struct"].dtype.type,
-                df["col_decimal"].dtype.type,
-            ]
-        )
+        dtypes = tuple(t.type for t in df.dtypes)
         assert dtypes == tuple(
             [
                 np.bool_,
@@ -722,50 +593,10 @@ class TestPandasCursor:
             ]
         )
         rows = [
-            tuple(
-                [
-                    row["col_boolean"],
-                    row["col_tinyint"],
-                    row["col_smallint"],
-                    row["col_int"],
-                    row["col_bigint"],
-                    row["col_float"],
-                    row["col_double"],
-                    row["col_string"],
-                    row["col_varchar"],
-                    row["col_timestamp"],
-                    row["col_date"],
-                    row["col_binary"],
-                    [a for a in row["col_array"]],
-                    row["col_map"],
-                    row["col_struct"],
-                    row["col_decimal"],
-                ]
-            )
-            for _, row in df.iterrows()
-        ]
-        assert rows == [
-            (
-                True,
-                127,
-                32767,
-                2147483647,
-                9223372036854775807,
-                0.5,
-                0.25,
-                "a string",
-                "varchar",
-                pd.Timestamp(2017, 1, 1, 0, 0, 0),
-                datetime(2017, 1, 2).date(),
-                b"123",
-                # ValueError: The truth value of an array with more than one element is ambiguous.
-                # Use a.any() or a.all()
-                [a for a in np.array([1, 2], dtype=np.int32)],
-                [(1, 2), (3, 4)],
-                {"a": 1, "b": 2},
-                Decimal("0.1"),
-            )
+            row[:12] + ([a for a in row[12]],) + row[13:]
+            for row in df.itertuples(index=False, name=None)
         ]
+        assert rows == _EXPECTED_ROWS_COMPLEX_UNLOAD_PYARROW
 
     @pytest.mark.parametrize(
         "pandas_cursor",
@@ -871,38 +702,19 @@ class TestPandasCursor:
             )
             for _, row in df.iterrows()
         ]
-        assert rows == [
-            (
-                True,
-                127,
-                32767,
-                2147483647,
-                9223372036854775807,
-                0.5,
-                0.25,
-                "a string",
-                "varchar",
-                pd.Timestamp(2017, 1, 1, 0, 0, 0),
-                pd.Timestamp(2017, 1, 2, 0, 0, 0),
-                b"123",
-                # ValueError: The truth value of an array with more than one element is ambiguous.
-                # Use a.any() or a.all()
-                [a for a in np.array([1, 2], dtype=np.int32)],
-                {1: 2, 3: 4},
-                # In the case of fastparquet, decimal types are handled as floats.
-                0.1,
-                1,
-                2,
-            )
-        ]
+        assert rows == _EXPECTED_ROWS_COMPLEX_UNLOAD_FASTPARQUET
 
     def test_cancel(self, pandas_cursor):
         def cancel(c):
-            time.sleep(random.randint(5, 10))
+            # Cancel as soon as Athena has accepted the query.
+            # If execute fails before that, cancel raises and the future re-raises it below.
+            deadline = time.monotonic() + 30
+            while not c.query_id and time.monotonic() < deadline:
+                time.sleep(0.1)
             c.cancel()
 
         with ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(cancel, pandas_cursor)
+            future = executor.submit(cancel, pandas_cursor)
 
             pytest.raises(
                 DatabaseError,
@@ -914,6 +726,8 @@ class TestPandasCursor:
                     """
                 ),
             )
+            future.result()
+        assert pandas_cursor.query_id
 
     def test_cancel_initial(self, pandas_cursor):
         pytest.raises(ProgrammingError, pandas_cursor.cancel)
@@ -929,38 +743,16 @@ class TestPandasCursor:
         cursor.close()
         conn.close()
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine, chunksize",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto", None),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000_000),
-            ({"cursor_kwargs": {"unload": True}}, "auto", None),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow", None),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet", None),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine_and_chunksize
     def test_show_columns(self, pandas_cursor, parquet_engine, chunksize):
         pandas_cursor.execute("SHOW COLUMNS IN one_row", engine=parquet_engine, chunksize=chunksize)
         assert pandas_cursor.description == [("field", "string", None, None, 0, 0, "UNKNOWN")]
         assert pandas_cursor.fetchall() == [("number_of_rows      ",)]
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine, chunksize",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto", None),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000),
-            ({"cursor_kwargs": {"unload": False}}, "auto", 1_000_000),
-            ({"cursor_kwargs": {"unload": True}}, "auto", None),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow", None),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet", None),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine_and_chunksize
     def test_empty_result_ddl(self, pandas_cursor, parquet_engine, chunksize):
         table = "test_pandas_cursor_empty_result_" + "".join(
-            [random.choice(string.ascii_lowercase + string.digits) for _ in range(10)]
+            random.choices(_TABLE_SUFFIX_ALPHABET, k=10)
         )
         df = pandas_cursor.execute(
             f"""
@@ -997,16 +789,7 @@ class TestPandasCursor:
         assert df.shape[0] == 0
         assert df.shape[1] == 0
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow"),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet"),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine
     def test_integer_na_values(self, pandas_cursor, parquet_engine):
         df = pandas_cursor.execute(
             """
@@ -1015,31 +798,15 @@ class TestPandasCursor:
             engine=parquet_engine,
         ).as_pandas()
         if pandas_cursor._unload:
-            rows = [
-                tuple(
-                    [
-                        True if math.isnan(row["a"]) else row["a"],
-                        True if math.isnan(row["b"]) else row["b"],
-                    ]
-                )
-                for _, row in df.iterrows()
-            ]
             # If the UNLOAD option is enabled, it is converted to float for some reason.
-            assert rows == [(1.0, 2.0), (1.0, True), (True, True)]
+            np.testing.assert_array_equal(
+                df.to_numpy(), np.array([[1.0, 2.0], [1.0, np.nan], [np.nan, np.nan]])
+            )
         else:
-            rows = [tuple([row["a"], row["b"]]) for _, row in df.iterrows()]
+            rows = list(df.itertuples(index=False, name=None))
             assert rows == [(1, 2), (1, pd.NA), (pd.NA, pd.NA)]
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow"),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet"),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine
     def test_float_na_values(self, pandas_cursor, parquet_engine):
         df = pandas_cursor.execute(
             """
@@ -1047,19 +814,9 @@ class TestPandasCursor:
             """,
             engine=parquet_engine,
         ).as_pandas()
-        rows = [tuple([row[0]]) for _, row in df.iterrows()]
-        np.testing.assert_equal(rows, [(0.33,), (np.nan,)])
+        np.testing.assert_array_equal(df["col"].to_numpy(), np.array([0.33, np.nan]))
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow"),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet"),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine
     def test_boolean_na_values(self, pandas_cursor, parquet_engine):
         df = pandas_cursor.execute(
             """
@@ -1068,30 +825,14 @@ class TestPandasCursor:
             engine=parquet_engine,
         ).as_pandas()
         if parquet_engine == "fastparquet":
-            rows = [
-                tuple(
-                    [
-                        True if math.isnan(row["a"]) else row["a"],
-                        True if math.isnan(row["b"]) else row["b"],
-                    ]
-                )
-                for _, row in df.iterrows()
-            ]
-            assert rows == [(1.0, 0.0), (0.0, True), (True, True)]
+            np.testing.assert_array_equal(
+                df.to_numpy(), np.array([[1.0, 0.0], [0.0, np.nan], [np.nan, np.nan]])
+            )
         else:
-            rows = [tuple([row["a"], row["b"]]) for _, row in df.iterrows()]
+            rows = list(df.itertuples(index=False, name=None))
             assert rows == [(True, False), (False, None), (None, None)]
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow"),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet"),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine
     def test_executemany(self, pandas_cursor, parquet_engine):
         rows = [(1, "foo"), (2, "bar"), (3, "jim o'rourke")]
         table_name = "execute_many_pandas" + (
@@ -1102,18 +843,11 @@ class TestPandasCursor:
             [{"a": a, "b": b} for a, b in rows],
         )
         pandas_cursor.execute(f"SELECT * FROM {table_name}", engine=parquet_engine)
-        assert sorted(pandas_cursor.fetchall()) == [(a, b) for a, b in rows]
+        result = pandas_cursor.fetchall()
+        assert len(result) == len(rows)
+        assert set(result) == set(rows)
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow"),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet"),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine
     def test_executemany_fetch(self, pandas_cursor, parquet_engine):
         pandas_cursor.executemany("SELECT %(x)d AS x FROM one_row", [{"x": i} for i in range(1, 2)])
         # Operations that have result sets are not allowed with executemany.
@@ -1122,16 +856,7 @@ class TestPandasCursor:
         pytest.raises(ProgrammingError, pandas_cursor.fetchone)
         pytest.raises(ProgrammingError, pandas_cursor.as_pandas)
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow"),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet"),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine
     def test_not_skip_blank_lines(self, pandas_cursor, parquet_engine):
         pandas_cursor.execute(
             """
@@ -1141,16 +866,7 @@ class TestPandasCursor:
         )
         assert len(pandas_cursor.fetchall()) == 2
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow"),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet"),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine
     def test_empty_and_null_string(self, pandas_cursor, parquet_engine):
         # TODO https://github.com/laughingman7743/PyAthena/issues/118
         query = """
@@ -1160,18 +876,7 @@ class TestPandasCursor:
         pandas_cursor.execute(query, engine=parquet_engine)
         if pandas_cursor._unload:
             # NULL and empty characters are correctly converted when the UNLOAD option is enabled.
-            np.testing.assert_equal(
-                pandas_cursor.fetchall(),
-                [("", "a"), ("N/A", "a"), ("NULL", "a"), (None, "a")],
-            )
-        else:
-            np.testing.assert_equal(
-                pandas_cursor.fetchall(),
-                [(np.nan, "a"), ("N/A", "a"), ("NULL", "a"), (np.nan, "a")],
-            )
-        pandas_cursor.execute(query, na_values=None, engine=parquet_engine)
-        if pandas_cursor._unload:
-            # NULL and empty characters are correctly converted when the UNLOAD option is enabled.
+            # The na_values option only applies to CSV results, so there is nothing to re-run.
             assert pandas_cursor.fetchall() == [
                 ("", "a"),
                 ("N/A", "a"),
@@ -1179,6 +884,11 @@ class TestPandasCursor:
                 (None, "a"),
             ]
         else:
+            np.testing.assert_equal(
+                pandas_cursor.fetchall(),
+                [(np.nan, "a"), ("N/A", "a"), ("NULL", "a"), (np.nan, "a")],
+            )
+            pandas_cursor.execute(query, na_values=None, engine=parquet_engine)
             assert pandas_cursor.fetchall() == [
                 ("", "a"),
                 ("N/A", "a"),
@@ -1186,16 +896,7 @@ class TestPandasCursor:
                 ("", "a"),
             ]
 
-    @pytest.mark.parametrize(
-        "pandas_cursor, parquet_engine",
-        [
-            ({"cursor_kwargs": {"unload": False}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "auto"),
-            ({"cursor_kwargs": {"unload": True}}, "pyarrow"),
-            ({"cursor_kwargs": {"unload": True}}, "fastparquet"),
-        ],
-        indirect=["pandas_cursor"],
-    )
+    @_parametrize_engine
     def test_null_decimal_value(self, pandas_cursor, parquet_engine):
         pandas_cursor.execute("SELECT CAST(null AS DECIMAL) AS col_decimal", engine=parquet_engine)
         if parquet_engine == "fastparquet":
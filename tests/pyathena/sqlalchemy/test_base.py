@@ -1389,6 +1389,43 @@ OUTPUTFORMAT 'org.apache.hadoop.hive.ql.io.HiveIgnoreKeyTextOutputFormat'
         ).fetchall()
         assert rows == [("Road St",)]
 
+    def test_struct_cache_key(self, engine):
+        engine, conn = engine
+        struct = pysqlalchemy.types.STRUCT(name=types.VARCHAR, age=types.INTEGER)
+        assert struct._static_cache_key == (
+            pysqlalchemy.types.STRUCT(name=types.VARCHAR(), age=types.INTEGER())._static_cache_key
+        )
+        assert struct._static_cache_key != (
+            pysqlalchemy.types.STRUCT(name=types.VARCHAR, age=types.BIGINT)._static_cache_key
+        )
+        assert struct._static_cache_key != (
+            pysqlalchemy.types.STRUCT(name=types.VARCHAR, married=types.INTEGER)._static_cache_key
+        )
+
+        table = Table("test_struct_cache_key", MetaData(), Column("col_struct", struct))
+        select = sqlalchemy.select(table.c.col_struct.NAME)
+        assert select._generate_cache_key() is not None
+        assert str(select.compile(bind=conn)) == (
+            "SELECT test_struct_cache_key.col_struct.NAME AS anon_1 \nFROM test_struct_cache_key"
+        )
+
+        # Accessing different fields of the same type must not share a compiled statement.
+        compiled_cache = {}
+        compiled = [
+            str(
+                sqlalchemy.select(table.c.col_struct[field])._compile_w_cache(
+                    conn.dialect, compiled_cache=compiled_cache, column_keys=[]
+                )[0]
+            )
+            for field in ["name", "age", "name"]
+        ]
+        assert compiled == [
+            "SELECT test_struct_cache_key.col_struct.name AS anon_1 \nFROM test_struct_cache_key",
+            "SELECT test_struct_cache_key.col_struct.age AS anon_1 \nFROM test_struct_cache_key",
+            "SELECT test_struct_cache_key.col_struct.name AS anon_1 \nFROM test_struct_cache_key",
+        ]
+        assert len(compiled_cache) == 2
+
     def test_cast_as_varchar(self, engine):
         engine, conn = engine
 
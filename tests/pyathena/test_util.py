@@ -2,7 +2,7 @@
 import pytest
 
 from pyathena import DataError
-from pyathena.util import parse_output_location
+from pyathena.util import parse_output_location, strtobool
 
 
 class TestUtil:
@@ -15,3 +15,14 @@ class TestUtil:
         # invalid
         with pytest.raises(DataError):
             parse_output_location("http://foobar")
+
+    def test_strtobool(self):
+        for value in ["y", "yes", "t", "true", "on", "1", "TRUE", "True", "On"]:
+            assert strtobool(value) is True
+        for value in ["n", "no", "f", "false", "off", "0", "FALSE", "False", "Off"]:
+            assert strtobool(value) is False
+
+        with pytest.raises(ValueError):
+            strtobool("/path/to/cacert.pem")
+        with pytest.raises(ValueError):
+            strtobool("")